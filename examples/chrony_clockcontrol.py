@@ -11,11 +11,13 @@
 
 from __future__ import print_function
 from enum import Enum, auto
-import re, sys, os, shlex, subprocess, tempfile
+import sys, os, shlex, shutil, subprocess, tempfile
 
 # Edit this if the EnvironmentFile is in a non-standard location
 chronyconf = '/etc/sysconfig/chronyd'
 
+OPTIONS_PREFIX = 'OPTIONS="'
+
 class Operation(Enum):
     ENABLE = auto()
     DISABLE = auto()
@@ -30,6 +32,26 @@ def usage():
         file=sys.stderr)
     exit(1)
 
+def backup_once(src, dst):
+    # Hard link the backup where possible as no data need be copied; the
+    # original is replaced rather than modified in place, so the backup
+    # never changes through the shared inode.
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        pass
+    except OSError:
+        shutil.copy2(src, dst)
+
+def file_op(op, src, dst):
+    # Copy or move a file, returning an exit code like the equivalent command
+    try:
+        op(src, dst)
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
 def update(op):
     # Write updated config to a temp file:
     # Preserve OPTIONS other than '-x' and any other comments/config
@@ -39,9 +61,9 @@ def update(op):
     with temp as outfile:
         with open(chronyconf,'r') as infile:
             for line in infile:
-                m = re.match('OPTIONS="(.*)"', line)
-                if m:
-                    oldoptions = shlex.split(m.group(1))
+                end = line.rfind('"')
+                if line.startswith(OPTIONS_PREFIX) and end >= len(OPTIONS_PREFIX):
+                    oldoptions = shlex.split(line[len(OPTIONS_PREFIX):end])
                     newoptions = [option for option in oldoptions if option != '-x']
                     if op == Operation.DISABLE:
                         newoptions.append('-x')
@@ -49,19 +71,22 @@ def update(op):
                 print(line, end='', file=outfile)
 
     # Backup the original config (once only)
-    command = "cp -n '" + chronyconf + "' '" + chronyconf + ".bak'"
-    rc = subprocess.call(command, shell=True)
+    rc = file_op(backup_once, chronyconf, chronyconf + '.bak')
 
     if rc == 0:
         # Make the revised config the active one
-        command = "mv -f '" + temp.name + "' '" + chronyconf + "'"
-        rc = subprocess.call(command, shell=True)
+        rc = file_op(os.replace, temp.name, chronyconf)
 
     return rc
 
 def restart():
     # Now try to restart chronyd with the new options
-    rc = subprocess.call('systemctl restart chronyd.service', shell=True)
+    try:
+        rc = subprocess.run(['systemctl', 'restart', 'chronyd.service']).returncode
+    except OSError as e:
+        # Fail with the exit code the shell gives for a command it cannot run
+        print(e, file=sys.stderr)
+        rc = 127
 
     if rc != 0:
         print('systemctl restart returned ', rc, file=sys.stderr)
@@ -78,13 +103,13 @@ def main():
     except:
         usage()
 
+    saveconf = '{}.save.{:d}'.format(chronyconf, os.getppid())
+
     if op == Operation.SAVE:
-        command = "cp '{}' '{}.save.{:d}'".format(chronyconf, chronyconf, os.getppid())
-        rc = subprocess.call(command, shell=True)
+        rc = file_op(shutil.copy2, chronyconf, saveconf)
 
     elif op == Operation.RESTORE or op == Operation.RESTORENORESTART:
-        command = "mv '{}.save.{:d}' '{}'".format(chronyconf, os.getppid(), chronyconf)
-        rc = subprocess.call(command, shell=True)
+        rc = file_op(shutil.move, saveconf, chronyconf)
         if rc == 0 and op == Operation.RESTORE:
             rc = restart()
 
@@ -22,21 +22,47 @@
 # [ptp]
 # remote_monitor
 
+import bisect
 import curses
-import time
-import json
+import functools
+import os
+import selectors
 import sys
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
 
+# Use orjson for decoding records if available as it is considerably
+# faster than the standard library json module on busy monitoring logs.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+# Use inotify to learn when the log has been written to if available,
+# otherwise the log is polled each time around the main loop.
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
 #############
 # Global Variables
 #############
 
 nodes = {}
-events = {}
+node_order = []
+events = OrderedDict()
+sorted_events = None
+log_buffer = bytearray()
 event_shortcuts = []
 details_selected = None
 details_type = "uncleared events"
+dirty = { 'nodes': True, 'alarms': True, 'events': True, 'details': True }
+last_redraw = 0.0
+last_age_redraw = 0.0
 
 #############
 # Constants
@@ -46,6 +72,39 @@ COL_SYNCED=1
 COL_ALARMED=2
 COL_LINK=3
 
+K_REFRESH=12 # ^L
+K_QUIT=ord('q')
+K_CLEAR=ord('c')
+K_CLEAR_EVENT=ord(' ')
+K_SHORTCUT=ord('0')
+
+LOG_READ_SIZE=65536
+
+# ncurses stores window dimensions as shorts
+MAX_PAD_ROWS=32767
+
+# Limits on the number of uncleared events kept, after which the least
+# recently raised is discarded, and on the instances kept for each.
+MAX_EVENTS=1000
+MAX_EVENT_INSTANCES=100
+
+# Minimum interval between redraws, so that bursts of records are
+# coalesced into a single update of the display.
+REDRAW_INTERVAL=0.05
+
+# Interval at which the ages of records and events are redrawn.
+AGE_REDRAW_INTERVAL=1.0
+
+# Layout of the rows in the nodes, events and event details panes. The
+# header rows never change so are only formatted once.
+NODE_ROW_PREFIX="%-25s | %-6d | %13.03f | %13.03f | %9s | %3s | %3s | %4s | "
+NODE_ROW_SUFFIX=" | %-44s\n"
+NODES_HEADER=("%-25s | %-6s | %13s | %13s | %9s | %3s | %3s | %4s | %7s | %7s | %-44s\n" %
+              ("port", "domain", "offset", "mpd", "state", "sel", "syn", "alrm", "last rx", "last st", "address"))
+EVENT_ROW="%24s %s%s\n"
+DETAILS_ROW="%27s | %9s | %s\n"
+DETAILS_HEADER=DETAILS_ROW % ("time", "state", "alarms")
+
 #############
 # Functions to process JSON records and save in appropriate local data structures,
 # generally replacing the previous value attached to a node in the nodes dictionary.
@@ -54,26 +113,56 @@ COL_LINK=3
 def process_node(record):
     if not (record['port-id'] in nodes):
         nodes[record['port-id']] = record
+        bisect.insort(node_order, record['port-id'])
+        dirty['nodes'] = True
 
 def process_rx_event(record):
     node = nodes[record['node']]
     node['last_rx_event'] = record
+    node['display'] = None
+    dirty['nodes'] = True
 
 def process_tx_event(record):
     node = nodes[record['node']]
     node['last_tx_event'] = record
 
 def add_event(record, name, description = None):
+    global sorted_events
     event = (record['node'], name)
     if event in events:
         events[event]['instances'].append(record)
+        events.move_to_end(event)
     else:
-        events[event] = { 'time': record['monitor-timestamp'], 'description': description, 'instances': [record] }
+        events[event] = { 'time': record['monitor-timestamp'], 'description': description, 'instances': deque([record], MAX_EVENT_INSTANCES) }
+        if len(events) > MAX_EVENTS:
+            events.popitem(last=False)
+        sorted_events = None
+    dirty['events'] = True
     curses.beep()
     curses.flash()
 
 def process_slave_status(record):
     node = nodes[record['node']]
+
+    # Keep the combined list of alarms with the record rather than
+    # rebuilding it every time the record is displayed.
+    all_alarms = tuple(record['msg-alarms'] + record['alarms'])
+    record['_all_alarms'] = all_alarms
+
+    # Most status records repeat the previous one. Unless a bond change
+    # is being reported these cannot raise events or change what is shown
+    # other than the time of the last record, so skip the rest.
+    fingerprint = (record['state'], record['selected'], record['in-sync'],
+                   all_alarms)
+    if (not record['bond-changed'] and
+        node.get('status_fingerprint') == fingerprint):
+        node['last_slave_status'] = record
+        return
+    node['status_fingerprint'] = fingerprint
+    node['display'] = None
+
+    dirty['nodes'] = True
+    dirty['alarms'] = True
     if not('last_slave_status' in node):
         node['last_slave_status'] = record
     else:
@@ -89,9 +178,7 @@ def process_slave_status(record):
             add_event(record, "bond-changed")
 
         # Raise an event if an alarm is set when none were before
-        all_alarms = record['msg-alarms'] + record['alarms']
-        if (len(all_alarms) != 0 and
-            (len(previous['msg-alarms']) == 0 and len(previous['alarms']) == 0)):
+        if (len(all_alarms) != 0 and len(previous['_all_alarms']) == 0):
             add_event(record, "alarmed", ','.join(all_alarms))
 
         # Raise an event if there is a transition from the slave state
@@ -102,16 +189,19 @@ def process_slave_status(record):
         if (not (record['in-sync']) and previous['in-sync']):
             add_event(record, "lost-sync")
 
+record_handlers = {
+    'node': process_node,
+    'rx-event': process_rx_event,
+    'tx-event': process_tx_event,
+    'slave-status': process_slave_status,
+}
+
 def process_line(line):
-    obj = json.loads(line)
-    if 'node' in obj:
-        process_node(obj['node'])
-    if 'rx-event' in obj:
-        process_rx_event(obj['rx-event'])
-    if 'tx-event' in obj:
-        process_tx_event(obj['tx-event'])
-    if 'slave-status' in obj:
-        process_slave_status(obj['slave-status'])
+    # Each line holds a single record keyed by its type
+    for typ, record in json_loads(line).items():
+        handler = record_handlers.get(typ)
+        if handler:
+            handler(record)
 
 #############
 # Functions for rendering the console.
@@ -134,7 +224,9 @@ def fullupdate_display():
     draw_window(alarms_win, "current alarms")
     draw_window(events_win, "uncleared events")
     draw_details_window()
-    update_display()
+    for pane in dirty:
+        dirty[pane] = True
+    update_display(force=True)
 
 def update_window(win, pad):
     (pad_rows, pad_cols) = pad.getmaxyx()
@@ -144,14 +236,33 @@ def update_window(win, pad):
                   min(win_cols - 2, pad_cols))
     win.refresh()
 
+def resize_pad(pad, win, rows):
+    # Size a pad to the rows of content about to be drawn in it, but
+    # no smaller than the window so that any stale lines are overwritten.
+    (pad_rows, pad_cols) = pad.getmaxyx()
+    (win_rows, win_cols) = win.getmaxyx()
+    rows = min(max(rows, win_rows), MAX_PAD_ROWS)
+    if rows != pad_rows:
+        pad.resize(rows, pad_cols)
+
+def wrapped_rows(length, pad):
+    # Number of rows a line of the given length occupies in a pad.
+    (pad_rows, pad_cols) = pad.getmaxyx()
+    return length // pad_cols + 1
+
 #############
-# Helper function to work out how long ago a textual date/time was and show
-# the difference in reasonable units.
+# Helper functions to work out how long ago a textual date/time was and show
+# the difference in reasonable units. Timestamps are parsed once and cached
+# as the same records are shown on every redraw; the caller supplies the
+# current time so that it is only taken once per redraw.
 #############
 
-def time_delta(timestr):
-    t = datetime.strptime(timestr, "%Y-%m-%d %H:%M:%S.%f")
-    td = (datetime.now() - t).seconds
+@functools.lru_cache(maxsize=4096)
+def parse_timestamp(timestr):
+    return datetime.strptime(timestr, "%Y-%m-%d %H:%M:%S.%f")
+
+def time_delta(timestr, now):
+    td = int((now - parse_timestamp(timestr)).total_seconds())
     if td == 0:
         return "now"
     if td < 61:
@@ -170,62 +281,85 @@ def time_delta(timestr):
 # known remote node.
 #############
 
+# Function to format the parts of a node's row that only change when a
+# new record is received for it. The ages of the last records are filled
+# in between the prefix and suffix each time the row is drawn.
+def node_display(node):
+    offset = float('nan')
+    mpd = float('nan')
+    if 'last_rx_event' in node:
+        rx_event = node['last_rx_event']
+        offset = rx_event['offset-from-master']
+        mpd = rx_event['mean-path-delay']
+    state = ""
+    sel_str = ""
+    syn_str = ""
+    alrm_str = ""
+    selected = None
+    in_sync = None
+    alarmed = None
+    if 'last_slave_status' in node:
+        slave_status = node['last_slave_status']
+        state = slave_status['state']
+        selected = slave_status['selected']
+        in_sync = slave_status['in-sync']
+        alarmed = len(slave_status['_all_alarms']) != 0
+        if selected:
+            sel_str = 'Sel'
+        else:
+            sel_str = '---'
+        if in_sync:
+            syn_str = 'Syn'
+        else:
+            syn_str = '---'
+        if alarmed:
+            alrm_str = 'ALRM'
+        else:
+            alrm_str = '----'
+
+    colour = curses.color_pair(0)
+    if (selected and in_sync):
+        colour = curses.color_pair(COL_SYNCED)
+    if (alarmed):
+        colour = curses.color_pair(COL_ALARMED)
+
+    prefix = NODE_ROW_PREFIX % (
+        node['port-id'], node['domain'],
+        offset, mpd,
+        state,
+        sel_str, syn_str, alrm_str)
+    suffix = NODE_ROW_SUFFIX % node['address']
+    return (prefix, colour, suffix)
+
 def update_nodes():
-    nlist = sorted(nodes, key=lambda x: nodes[x]['port-id'])
+    now = datetime.now()
+    resize_pad(nodes_pad, nodes_win, len(node_order) + 2)
     nodes_pad.erase()
-    nodes_pad.addstr("%-25s | %-6s | %13s | %13s | %9s | %3s | %3s | %4s | %7s | %7s | %-44s\n" % ("port", "domain", "offset", "mpd", "state", "sel", "syn", "alrm", "last rx", "last st", "address"))
-    for port in nlist:
+    nodes_pad.addstr(NODES_HEADER)
+
+    # Consecutive rows in the same colour are written to the pad together
+    rows = []
+    rows_colour = None
+    for port in node_order:
         node = nodes[port]
-        offset = float('nan')
-        mpd = float('nan')
+        if node.get('display') is None:
+            node['display'] = node_display(node)
+        prefix, colour, suffix = node['display']
         last_rx = "never"
         if 'last_rx_event' in node:
-            rx_event = node['last_rx_event']
-            offset = rx_event['offset-from-master']
-            mpd = rx_event['mean-path-delay']
-            last_rx = time_delta(rx_event['monitor-timestamp'])
-        state = ""
-        sel_str = ""
-        syn_str = ""
-        alrm_str = ""
+            last_rx = time_delta(node['last_rx_event']['monitor-timestamp'], now)
         last_slave_status = "never"
-        selected = None
-        in_sync = None
-        alarmed = None
         if 'last_slave_status' in node:
-            slave_status = node['last_slave_status']
-            state = slave_status['state']
-            selected = slave_status['selected']
-            in_sync = slave_status['in-sync']
-            alarmed = len(slave_status['msg-alarms']) != 0 or len(slave_status['alarms']) != 0
-            last_slave_status = time_delta(slave_status['monitor-timestamp'])
-            if selected:
-                sel_str = 'Sel'
-            else:
-                sel_str = '---'
-            if in_sync:
-                syn_str = 'Syn'
-            else:
-                syn_str = '---'
-            if alarmed:
-                alrm_str = 'ALRM'
-            else:
-                alrm_str = '----'
+            last_slave_status = time_delta(node['last_slave_status']['monitor-timestamp'], now)
 
-        colour = curses.color_pair(0)
-        if (selected and in_sync):
-            colour = curses.color_pair(COL_SYNCED)
-        if (alarmed):
-            colour = curses.color_pair(COL_ALARMED)
+        if colour != rows_colour and rows:
+            nodes_pad.addstr(''.join(rows), rows_colour)
+            rows = []
+        rows_colour = colour
+        rows.append("%s%7s | %7s%s" % (prefix, last_rx, last_slave_status, suffix))
 
-        nodes_pad.addstr("%-25s | %-6d | %13.03f | %13.03f | %9s | %3s | %3s | %4s | %7s | %7s | %-44s\n" % (
-            node['port-id'], node['domain'],
-            offset, mpd,
-            state,
-            sel_str, syn_str, alrm_str,
-            last_rx,
-            last_slave_status,
-            node['address']), colour)
+    if rows:
+        nodes_pad.addstr(''.join(rows), rows_colour)
 
     update_window(nodes_win, nodes_pad)
 
@@ -234,22 +368,24 @@ def update_nodes():
 #############
 
 def update_alarms():
-    nlist = sorted(nodes, key=lambda x: nodes[x]['port-id'])
     alarms = {}
-    alarms_pad.erase()
-    for port in nlist:
+    for port in node_order:
         node = nodes[port]
         if 'last_slave_status' in node:
             slave_status = node['last_slave_status']
-            for alarm in slave_status['msg-alarms'] + slave_status['alarms']:
-                if not alarm in alarms:
-                    alarms[alarm] = []
-                lst = alarms[alarm]
-                lst.append(node)
-    for alarm in alarms:
-        alarms_pad.addstr("%s\n" % alarm)
-        for node in alarms[alarm]:
-            alarms_pad.addstr("    %s\n" % node['port-id'])
+            for alarm in slave_status['_all_alarms']:
+                alarms.setdefault(alarm, []).append(node)
+    resize_pad(alarms_pad, alarms_win,
+               len(alarms) + sum(len(lst) for lst in alarms.values()) + 1)
+    alarms_pad.erase()
+    try:
+        for alarm in alarms:
+            alarms_pad.addstr("%s\n" % alarm)
+            for node in alarms[alarm]:
+                alarms_pad.addstr("    %s\n" % node['port-id'])
+    except curses.error:
+        # The pad is full. Nothing beyond this point could be shown anyway.
+        pass
 
     update_window(alarms_win, alarms_pad)
 
@@ -259,15 +395,32 @@ def update_alarms():
 #############
 
 def update_events():
-    elist = sorted(events, key=lambda x: x[1])
+    now = datetime.now()
+    global event_shortcuts, sorted_events
+    if sorted_events is None:
+        sorted_events = sorted(events, key=lambda x: (x[1], events[x]['time']))
+    elist = sorted_events
     prevtyp = ''
-    global event_shortcuts
     event_shortcuts = []
     shortcut = 0
-    events_pad.erase()
+
+    # Format the rows first so that the pad can be sized to fit them. Each
+    # is preceded by two columns for the shortcut key.
+    event_rows = []
+    rows = len(set(typ for node, typ in elist)) + 3
     for event in elist:
         node, typ = event
         data = events[event]
+        description = ""
+        if (data['description'] != None):
+            description = " (%s)" % data['description']
+        row = EVENT_ROW % (node, time_delta(data['time'], now), description)
+        event_rows.append(row)
+        rows += wrapped_rows(2 + len(row), events_pad)
+    resize_pad(events_pad, events_win, rows)
+    events_pad.erase()
+    for event, row in zip(elist, event_rows):
+        node, typ = event
         if typ != prevtyp:
             events_pad.addstr("%s\n" % typ)
 
@@ -275,9 +428,6 @@ def update_events():
         if (typ == 'alarmed'):
             colour = curses.color_pair(COL_ALARMED)
 
-        description = ""
-        if (data['description'] != None):
-            description = " (%s)" % data['description']
         if shortcut < 10:
             events_pad.addstr(" ")
             events_pad.addstr(("%d" % shortcut), curses.A_UNDERLINE | curses.color_pair(COL_LINK))
@@ -285,7 +435,7 @@ def update_events():
             shortcut = shortcut + 1
         else:
             events_pad.addstr("  ")
-        events_pad.addstr("%24s %s%s\n" % (node, time_delta(data['time']), description), colour)
+        events_pad.addstr(row, colour)
         prevtyp = typ
 
     if len(elist) != 0:
@@ -304,32 +454,132 @@ def update_details():
     if (details_selected):
         update_window(details_win, details_pad)
 
-def update_display():
-    update_nodes()
-    update_alarms()
-    update_events()
-    update_details()
+#############
+# Function to redraw the panes whose contents have changed since they were
+# last drawn. Redraws are rate limited unless forced.
+#############
+
+def update_display(force=False):
+    global last_redraw, last_age_redraw
+    now = time.monotonic()
+    if not force and now - last_redraw < REDRAW_INTERVAL:
+        return
+    if now - last_age_redraw >= AGE_REDRAW_INTERVAL:
+        dirty['nodes'] = True
+        dirty['events'] = True
+        last_age_redraw = now
+
+    redrawn = False
+    for pane, update in (('nodes', update_nodes),
+                         ('alarms', update_alarms),
+                         ('events', update_events)):
+        if dirty[pane]:
+            update()
+            dirty[pane] = False
+            redrawn = True
+
+    # The details pop-up overlaps the other panes so is redrawn on top
+    # of them whenever any of them change.
+    if redrawn or dirty['details']:
+        update_details()
+        dirty['details'] = False
+
+    if redrawn:
+        last_redraw = now
+
+def redraw_timeout():
+    # Time until update_display() next has something to redraw, either a
+    # pane already marked dirty or the ages shown.
+    due = last_redraw + REDRAW_INTERVAL
+    if not any(dirty.values()):
+        due = max(due, last_age_redraw + AGE_REDRAW_INTERVAL)
+    return max(due - time.monotonic(), 0)
 
 def select_details(event):
     global details_selected
     details_selected = event
 
-    details_pad.erase()
     if details_selected:
         e = events[details_selected]
         records = sorted(e['instances'], key=lambda x: x['monitor-timestamp'])
-        details_pad.addstr("%27s | %9s | %s\n" %
-                           ("time", "state", "alarms"))
-        for r in records:
-            details_pad.addstr("%27s | %9s | %s\n" %
-                               (r['monitor-timestamp'], r['state'],
-                                ' '.join(r['msg-alarms'] + r['alarms'])))
+        detail_rows = [DETAILS_ROW % (r['monitor-timestamp'], r['state'],
+                                      ' '.join(r['_all_alarms']))
+                       for r in records]
+        rows = wrapped_rows(len(DETAILS_HEADER), details_pad) + 3
+        for row in detail_rows:
+            rows += wrapped_rows(len(row), details_pad)
+        resize_pad(details_pad, details_win, rows)
+    details_pad.erase()
+    if details_selected:
+        details_pad.addstr(DETAILS_HEADER)
+        for row in detail_rows:
+            details_pad.addstr(row)
         details_pad.addstr("\n press ")
         details_pad.addstr("space", curses.A_UNDERLINE | curses.color_pair(COL_LINK))
         details_pad.addstr(" to clear this event\n")
 
     fullupdate_display()
 
+#############
+# Functions to handle keypresses. Different keys are handled depending on
+# whether the details pop-up is shown.
+#############
+
+def request_quit():
+    global doquit
+    doquit = True
+
+def clear_events():
+    global events, sorted_events, event_shortcuts
+    events = OrderedDict()
+    sorted_events = None
+    event_shortcuts = []
+    dirty['events'] = True
+
+def clear_selected_event():
+    global sorted_events
+    events.pop(details_selected, None)
+    sorted_events = None
+    dirty['events'] = True
+    select_details(None)
+
+def select_shortcut(shortcut):
+    # The event may have been discarded since the shortcuts were drawn
+    if shortcut < len(event_shortcuts) and event_shortcuts[shortcut] in events:
+        select_details(event_shortcuts[shortcut])
+
+key_handlers = {
+    K_REFRESH: fullupdate_display,
+    K_QUIT: request_quit,
+    K_CLEAR: clear_events,
+}
+for shortcut in range(10):
+    key_handlers[K_SHORTCUT + shortcut] = functools.partial(select_shortcut, shortcut)
+
+details_key_handlers = {
+    K_REFRESH: fullupdate_display,
+    K_CLEAR_EVENT: clear_selected_event,
+}
+
+#############
+# Function to process all complete records appended to the log since the
+# last call. A trailing incomplete line is held back until the rest of it
+# has been written.
+#############
+
+def read_log():
+    global log_buffer
+    while True:
+        chunk = os.read(logfd, LOG_READ_SIZE)
+        if not chunk:
+            return
+        log_buffer += chunk
+        lines = log_buffer.split(b'\n')
+        log_buffer = lines.pop()
+        for line in lines:
+            if line:
+                process_line(line)
+
 #############
 # Entry to the utility.
 #############
@@ -338,7 +588,7 @@ if len(sys.argv) != 2:
     print("single argument must be supplied with the path to the JSON Lines remote monitoring log")
     sys.exit(1)
 
-logfile = open(sys.argv[1], 'r')
+logfd = os.open(sys.argv[1], os.O_RDONLY)
 
 scr = curses.initscr()
 curses.start_color()
@@ -356,13 +606,25 @@ alarms_win = curses.newwin(smy - int(smy/2), int(smx/2), int(smy/2), 0)
 events_win = curses.newwin(smy - int(smy/2), smx - int(smx/2), int(smy/2), int(smx/2))
 details_win = curses.newwin(int(smy*3/4), int(smx*3/4), int(smy/8), int(smx/8))
 
-nodes_pad = curses.newpad(512, 256)
-alarms_pad = curses.newpad(512, 128)
-events_pad = curses.newpad(512, 128)
-details_pad = curses.newpad(512, 256)
+nodes_pad = curses.newpad(1, 256)
+alarms_pad = curses.newpad(1, 128)
+events_pad = curses.newpad(1, 128)
+details_pad = curses.newpad(1, 256)
+
+# Wake the main loop as soon as a key is pressed
+sel = selectors.DefaultSelector()
+sel.register(sys.stdin, selectors.EVENT_READ)
+
+# ... or as soon as the log is written to, if inotify can tell us
+log_watch = None
+if INotify:
+    log_watch = INotify()
+    log_watch.add_watch(sys.argv[1], flags.MODIFY)
+    sel.register(log_watch, selectors.EVENT_READ)
+log_pending = True
 
 # Inject a refresh request into the execution loop
-curses.ungetch(12)
+curses.ungetch(K_REFRESH)
 
 #############
 # Simple main execution loop.
@@ -375,6 +637,10 @@ curses.ungetch(12)
 #   - reads the remote monitoring JSON Lines log and
 #     calls processing functions on them
 #
+#   - sleeps until a key is pressed, the log is written to
+#     or the display is due to be redrawn (or the poll interval
+#     expires if the log cannot be watched)
+#
 #   - handles changes to the size of the terminal and
 #     resizes the windows
 #
@@ -386,30 +652,17 @@ while not(doquit):
     ch = 0
     while ch != -1:
         ch = scr.getch()
-        if ch == 12:
-            fullupdate_display()
         if details_selected:
-            if ch == ord(' '):
-                del events[details_selected]
-                select_details(None)
+            handler = details_key_handlers.get(ch)
         else:
-            if ch == ord('q'):
-                doquit = True
-            if ch == ord('c'):
-                events = {}
-                event_shortcuts = []
-            if ch >= ord('0') and (ch - ord('0')) < len(event_shortcuts):
-                select_details(event_shortcuts[ch - ord('0')])
+            handler = key_handlers.get(ch)
+        if handler:
+            handler()
 
     # Handle logging updates
-    pos = logfile.tell()
-    line = logfile.readline()
-    if not line:
-        update_display()
-        time.sleep(0.1)
-        logfile.seek(pos)
-    else:
-        process_line(line)
+    if log_pending:
+        read_log()
+    update_display()
 
     # Handle terminal size changes
     smy2,smx2 = scr.getmaxyx()
@@ -426,5 +679,19 @@ while not(doquit):
         details_win.mvwin(smy/8, smx/8)
         fullupdate_display()
 
+    # Wait for input. With inotify, sleep until a key is pressed, the log
+    # is written to or the display is next due to be redrawn. Regular files
+    # always poll as readable so without inotify the log cannot be waited
+    # on here and is instead polled on a short timeout.
+    if log_watch:
+        timeout = redraw_timeout()
+    else:
+        timeout = 0.1
+    ready = sel.select(timeout=timeout)
+    if log_watch:
+        log_pending = any(key.fileobj is log_watch for key, mask in ready)
+        if log_pending:
+            log_watch.read(timeout=0)
+
 # Clear up curses so that the terminal is nice again
 curses.endwin()
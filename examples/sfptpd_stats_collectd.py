@@ -9,6 +9,8 @@
 
 # You will also want to customise which data is sent to collectd
 # by modifying the collectd_reader() function near the end of this file.
+# Only the fields listed in Stat below are kept from each record, so add
+# any others you want to use there and in parse_stat().
 
 # You can uncomment the 'print stat' line below and run this script
 # from your shell to inspect the incoming data.
@@ -21,9 +23,18 @@ import stat
 import errno
 import json
 import collectd
+from collections import namedtuple
 from queue import Queue, Empty
 from threading import Thread
 
+# Use orjson for decoding records if available as it is considerably
+# faster than the standard library json module.
+try:
+	import orjson
+	json_loads = orjson.loads
+except ImportError:
+	json_loads = json.loads
+
 if not stat.S_ISFIFO(os.stat("/tmp/sfptpd_stats.jsonl").st_mode):
 	print(FIFO, 'is not a FIFO! Aborting...')
 	sys.exit(1)
@@ -35,22 +46,28 @@ except OSError as oe:
 
 queue = Queue(0)
 
+# The fields of each stats record that are used by this script
+Stat = namedtuple('Stat', ['instance', 'master', 'slave', 'offset'])
+
+def parse_stat(line):
+	obj = json_loads(line)
+	return Stat(obj['instance'],
+		    obj['clock-master']['name'],
+		    obj['clock-slave']['name'],
+		    obj['stats'].get('offset'))
+
 # FIFO reader thread, loops forever
 def read_thread():
 	while True:
-		with open(FIFO) as fifo:
-			data = ''
-			while True:
-				new_data = fifo.read(64)
-				if len(new_data) == 0: break # FIFO was closed
-				data += new_data
-				if "\n" not in data: continue
-				line = data[:data.index("\n")]
-				data = data[data.index("\n")+1:]
+		with open(FIFO, 'rb', buffering=65536) as fifo:
+			for line in fifo: # Ends when the FIFO is closed
+				# Report and skip any malformed record; if this thread
+				# died the FIFO would no longer be drained and sfptpd
+				# would block writing to it.
 				try:
-					queue.put(json.loads(line))
-				except ValueError:
-					print('Invalid JSON received:', line)
+					queue.put(parse_stat(line))
+				except Exception:
+					print('Invalid stats record received:', line.decode(errors='replace').rstrip())
 
 def start_reader_thread():
 	fifo_reader = Thread(target=read_thread)
@@ -66,8 +83,9 @@ if __name__=="__main__":
 		while True:
 			try:
 				stat = queue.get(timeout = 3)
-				print("Got data from '%s', offset = %f" % (stat['instance'], stat['stats'].get('offset', float('nan'))))
-				#print(stat) # Uncomment this to see the full objects
+				offset = stat.offset if stat.offset is not None else float('nan')
+				print("Got data from '%s', offset = %f" % (stat.instance, offset))
+				#print(stat) # Uncomment this to see all the fields kept
 			except Empty:
 				continue
 	except KeyboardInterrupt:
@@ -83,18 +101,21 @@ def collectd_initer():
 	collectd.debug('starting FIFO reader thread: %s' % FIFO)
 	start_reader_thread()
 
+# A single Values object is reused for every sample; only the fields
+# that differ between dispatches need to be set before each one.
+METRIC = collectd.Values(type = 'gauge')
+METRIC.plugin = 'sfptpd'
+
 def collectd_reader(input_data=None):
 	try:
 		while True:
 			stat = queue.get_nowait() # Get next entry
 			# Just track PTP offset to grandmaster. Adapt this to your needs
-			if stat['instance'].startswith('ptp') and \
-			   stat['clock-master']['name'] == 'gm' and \
-			   stat['clock-slave']['name'].startswith('phc') and \
-			   'offset' in stat['stats'].keys():
-				metric = collectd.Values(type = 'gauge');
-				metric.plugin = 'sfptpd'
-				metric.dispatch(values = [ stat['stats']['offset'] ])
+			if stat.instance.startswith('ptp') and \
+			   stat.master == 'gm' and \
+			   stat.slave.startswith('phc') and \
+			   stat.offset is not None:
+				METRIC.dispatch(values = [ stat.offset ])
 	except Empty:
 		return # We've processed everything in the queue
 
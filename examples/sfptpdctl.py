@@ -6,7 +6,11 @@
 import socket
 import sys
 
+if len(sys.argv) == 2:
+    command = sys.argv[1].encode()
+else:
+    command = ' '.join(sys.argv[1:]).encode()
+
+# The socket is closed on exit
 s = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
-s.connect('/var/run/sfptpd-control-v1.sock')
-s.send(' '.join(sys.argv[1:]).encode())
-s.close()
+s.sendto(command, '/var/run/sfptpd-control-v1.sock')